@@ -0,0 +1,36 @@
+# cython: language_level=3
+"""Cython-compiled arithmetic kernels.
+
+Build in place with ``python setup.py build_ext --inplace``. When the
+compiled extension is missing, calculator.py falls back to its
+pure-Python implementations, so building is optional.
+"""
+cimport cython
+
+from libc.math cimport NAN
+
+
+cpdef double add(double x, double y):
+    """Add two numbers."""
+    return x + y
+
+
+cpdef double subtract(double x, double y):
+    """Subtract the second number from the first."""
+    return x - y
+
+
+cpdef double multiply(double x, double y):
+    """Multiply two numbers."""
+    return x * y
+
+
+@cython.cdivision(True)
+cpdef double divide(double x, double y):
+    """
+    Divide the first number by the second.
+    Return NaN if dividing by zero.
+    """
+    if y == 0.0:
+        return NAN
+    return x / y
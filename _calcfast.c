@@ -0,0 +1,73 @@
+/* Hand-written C dispatch for the arithmetic kernels.
+ *
+ * Build in place with ``python setup.py build_ext --inplace``. Like
+ * _calc.pyx, the extension is optional: calculator.py keeps its Python
+ * dispatch table when the module is missing.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+/* Operation codes; keep in sync with _OP_CODES in calculator.py. */
+enum { OP_ADD = 0, OP_SUB = 1, OP_MUL = 2, OP_DIV = 3 };
+
+static PyObject *
+calc_dispatch(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    long op;
+    double x, y, r;
+
+    if (nargs != 3) {
+        PyErr_SetString(PyExc_TypeError, "calc_dispatch expects (op, x, y)");
+        return NULL;
+    }
+    op = PyLong_AsLong(args[0]);
+    if (op == -1 && PyErr_Occurred())
+        return NULL;
+    x = PyFloat_AsDouble(args[1]);
+    if (x == -1.0 && PyErr_Occurred())
+        return NULL;
+    y = PyFloat_AsDouble(args[2]);
+    if (y == -1.0 && PyErr_Occurred())
+        return NULL;
+
+    switch (op) {
+    case OP_ADD:
+        r = x + y;
+        break;
+    case OP_SUB:
+        r = x - y;
+        break;
+    case OP_MUL:
+        r = x * y;
+        break;
+    case OP_DIV:
+        r = (y == 0.0) ? Py_NAN : x / y;
+        break;
+    default:
+        PyErr_SetString(PyExc_ValueError, "invalid operation code");
+        return NULL;
+    }
+    return PyFloat_FromDouble(r);
+}
+
+static PyMethodDef calcfast_methods[] = {
+    {"calc_dispatch", (PyCFunction)calc_dispatch, METH_FASTCALL,
+     "calc_dispatch(op, x, y) -> float\n\n"
+     "Apply the operation selected by op (0=add, 1=subtract, 2=multiply,\n"
+     "3=divide) to x and y. Division by zero returns NaN."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef calcfast_module = {
+    PyModuleDef_HEAD_INIT,
+    "_calcfast",
+    "Hand-written C dispatch for the arithmetic kernels.",
+    -1,
+    calcfast_methods
+};
+
+PyMODINIT_FUNC
+PyInit__calcfast(void)
+{
+    return PyModule_Create(&calcfast_module);
+}
@@ -0,0 +1,24 @@
+"""Numba typing support for the arithmetic kernels.
+
+Importing this module registers a nopython-mode overload for divide(),
+so user @njit code calling it compiles to a single FP division instead
+of forcing a fallback to object mode. add/subtract/multiply need no
+registration: they alias the operator module functions, which Numba
+supports natively.
+
+Requires ``numba`` and ``numpy``; like batch.py, nothing else imports
+this module, so both stay optional dependencies.
+"""
+import numpy as np
+from numba.extending import overload
+
+import calculator
+
+
+@overload(calculator.divide)
+def _ov_divide(x, y):
+    def impl(x, y):
+        if y == 0.0:
+            return np.nan
+        return x / y
+    return impl
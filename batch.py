@@ -0,0 +1,48 @@
+"""Batched arithmetic over NumPy arrays, JIT-compiled with Numba.
+
+Requires ``numba`` and ``numpy``; the GUI in calculator.py does not
+import this module, so both stay optional dependencies.
+"""
+import numpy as np
+from numba import njit, prange
+
+# Operation codes for batch_apply
+OP_ADD = 0
+OP_SUBTRACT = 1
+OP_MULTIPLY = 2
+OP_DIVIDE = 3
+
+
+@njit(cache=True, parallel=True)
+def _batch_apply(op: int, x: np.ndarray, y: np.ndarray, out: np.ndarray) -> None:
+    for i in prange(x.shape[0]):
+        if op == OP_ADD:
+            out[i] = x[i] + y[i]
+        elif op == OP_SUBTRACT:
+            out[i] = x[i] - y[i]
+        elif op == OP_MULTIPLY:
+            out[i] = x[i] * y[i]
+        else:
+            out[i] = x[i] / y[i]
+
+
+def batch_apply(op: int, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Apply one operation element-wise over two float64 arrays.
+    Return a new array with the results.
+
+    ``op`` is one of OP_ADD, OP_SUBTRACT, OP_MULTIPLY or OP_DIVIDE.
+    Division follows IEEE 754 semantics, so dividing by zero yields
+    inf or nan rather than an error message.
+    """
+    if op not in (OP_ADD, OP_SUBTRACT, OP_MULTIPLY, OP_DIVIDE):
+        raise ValueError(f"Invalid operation code: {op}")
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    # The compiled loop indexes y with x's length and Numba does not
+    # bounds-check, so a mismatch must be rejected here.
+    if x.shape != y.shape:
+        raise ValueError(f"Shape mismatch: {x.shape} != {y.shape}")
+    out = np.empty_like(x)
+    _batch_apply(op, x, y, out)
+    return out
@@ -1,5 +1,8 @@
+import math
+import operator
 import tkinter as tk
-from typing import Union
+from functools import lru_cache, partial
+from typing import Callable
 
 # Constants
 DIVISION_BY_ZERO_ERROR = "Error: Division by zero"
@@ -7,65 +10,136 @@ INPUT_ERROR = "INPUT ERROR! Please enter valid numbers."
 MATH_ERROR = "MATH ERROR! Division by zero is not allowed."
 
 
-def add(x: float, y: float) -> float:
-    """Add two numbers."""
-    return x + y
+# add/subtract/multiply each wrap a single binary op; the C-implemented
+# operator functions do the same work without a Python frame per call.
+add = operator.add
+subtract = operator.sub
+multiply = operator.mul
 
 
-def subtract(x: float, y: float) -> float:
-    """Subtract the second number from the first."""
-    return x - y
-
-
-def multiply(x: float, y: float) -> float:
-    """Multiply two numbers."""
-    return x * y
-
-
-def divide(x: float, y: float) -> Union[float, str]:
+def divide(x: float, y: float) -> float:
     """
     Divide the first number by the second.
-    Return an error message if dividing by zero.
+    Return NaN if dividing by zero.
     """
     if y == 0:
-        return DIVISION_BY_ZERO_ERROR
+        return float('nan')
     return x / y
 
 
+try:
+    # Compiled kernels (see _calc.pyx); the pure-Python definitions above
+    # remain the fallback when the extension has not been built.
+    from _calc import add, subtract, multiply, divide
+except ImportError:
+    pass
+
+# divide() is pure and identical (x, y) pairs recur in practice, so repeated
+# calls return from the cache instead of re-running the zero check and
+# division.
+divide = lru_cache(maxsize=1024)(divide)
+
+# Dispatch table: one hash lookup instead of an if/elif chain of
+# string comparisons per call.
+_OPS = {'+': add, '-': subtract, '*': multiply, '/': divide}
+
+try:
+    # Hand-written C dispatcher (see _calcfast.c); optional like _calc.
+    import _calcfast
+except ImportError:
+    _calcfast = None
+
+if _calcfast is not None:
+    # Route the dispatch table through the C switch. partial() binds the
+    # operation code, so callers of _OPS are unchanged.
+    _OP_CODES = {'+': 0, '-': 1, '*': 2, '/': 3}
+    _OPS = {
+        symbol: partial(_calcfast.calc_dispatch, code)
+        for symbol, code in _OP_CODES.items()
+    }
+
+
+@lru_cache(maxsize=256)
+def _parse_float(s: str) -> float:
+    """Parse a decimal string, caching repeated inputs."""
+    return float(s)
+
+
 def calculate(
-    entry_num1: tk.Entry,
-    entry_num2: tk.Entry,
-    operation_var: tk.StringVar,
-    result_label: tk.Label
+    get_num1: Callable[[], str],
+    get_num2: Callable[[], str],
+    get_operation: Callable[[], str],
+    set_result: Callable[..., None]
 ) -> None:
-    """Perform the selected operation and display the result."""
+    """
+    Perform the selected operation and display the result.
+
+    Takes the bound widget accessors (Entry.get, StringVar.get,
+    Label.config) rather than the widgets themselves, so each click
+    skips the per-call attribute lookups.
+    """
     try:
-        num1 = float(entry_num1.get())
-        num2 = float(entry_num2.get())
-        operation = operation_var.get()
-
-        if operation == '+':
-            result = add(num1, num2)
-        elif operation == '-':
-            result = subtract(num1, num2)
-        elif operation == '*':
-            result = multiply(num1, num2)
-        elif operation == '/':
-            result = divide(num1, num2)
-            if result == DIVISION_BY_ZERO_ERROR:
-                result_label.config(text=MATH_ERROR)
-                return
-        else:
+        num1 = _parse_float(get_num1())
+        num2 = _parse_float(get_num2())
+        operation = get_operation()
+
+        op = _OPS.get(operation)
+        if op is None:
             result = "Invalid operation"
+        else:
+            result = op(num1, num2)
+            # Only division maps NaN to the error message; other
+            # operations can produce NaN from inputs like 'inf' and
+            # should display it as a result.
+            if operation == '/' and math.isnan(result):
+                set_result(text=MATH_ERROR)
+                return
 
-        result_label.config(text=f"Result: {result}")
+        # str() + concat skips the FORMAT_VALUE format-spec machinery an
+        # f-string would run per call.
+        set_result(text="Result: " + str(result))
     except ValueError:
-        result_label.config(text=INPUT_ERROR)
+        set_result(text=INPUT_ERROR)
 
 
-# Create the main window
-if __name__ == '__main__':
-    root = tk.Tk()
+def _make_calculate(
+    op: Callable[[float, float], float],
+    is_div: bool
+) -> Callable[..., None]:
+    """
+    Build a calculate() callback specialized for one operation.
+
+    The operation is bound into the closure, so a click skips the
+    dispatch lookup entirely and only re-reads the entries. Only the
+    division closure pays the NaN check; other operations display NaN
+    results as results.
+    """
+    def specialized(
+        get_num1: Callable[[], str],
+        get_num2: Callable[[], str],
+        set_result: Callable[..., None]
+    ) -> None:
+        try:
+            result = op(_parse_float(get_num1()), _parse_float(get_num2()))
+            if is_div and math.isnan(result):
+                set_result(text=MATH_ERROR)
+                return
+            set_result(text="Result: " + str(result))
+        except ValueError:
+            set_result(text=INPUT_ERROR)
+    return specialized
+
+
+# One specialized callback per operation; the GUI swaps between them
+# when the selected operation changes.
+_CALCS = {
+    symbol: _make_calculate(op, symbol == '/')
+    for symbol, op in _OPS.items()
+}
+
+
+def build_ui(root: tk.Tk) -> None:
+    """Build the calculator widgets onto an existing Tk root."""
     root.title("Simple Calculator")
 
     # Input fields and labels
@@ -81,27 +155,42 @@ if __name__ == '__main__':
     tk.Label(root, text="Second Number:") \
         .grid(row=1, column=0, padx=10, pady=10)
 
-    # Operation buttons
+    # Operation buttons, one per entry in the dispatch table
     operation_var = tk.StringVar(value='+')
-    operations = ['+', '-', '*', '/']
 
-    for i, op in enumerate(operations):
+    for i, op in enumerate(_OPS):
         tk.Radiobutton(root, text=op, variable=operation_var, value=op).grid(
             row=i, column=2, padx=10, pady=5)
 
-    # Calculate button
-    calculate_button = tk.Button(
-        root,
-        text="Calculate",
-        command=lambda: calculate(
-            entry_num1, entry_num2, operation_var, result_label
-        )
-    )
-    calculate_button.grid(row=4, column=0, columnspan=3, pady=10)
-
     # Result label
     result_label = tk.Label(root, text="Result: ")
     result_label.grid(row=5, column=0, columnspan=3, pady=10)
 
+    # Bind the widget accessors once so each click avoids the attribute
+    # lookups on the widgets.
+    get_num1, get_num2 = entry_num1.get, entry_num2.get
+    set_result = result_label.config
+
+    # Calculate button
+    calculate_button = tk.Button(root, text="Calculate")
+    calculate_button.grid(row=4, column=0, columnspan=3, pady=10)
+
+    # Re-bind the button to the specialized callback whenever the
+    # selected operation changes, so clicks skip the dispatch lookup.
+    def bind_operation(*_args: str) -> None:
+        specialized = _CALCS[operation_var.get()]
+        calculate_button.config(
+            command=lambda: specialized(get_num1, get_num2, set_result)
+        )
+
+    operation_var.trace_add('write', bind_operation)
+    bind_operation()
+
+
+# Create the main window
+if __name__ == '__main__':
+    root = tk.Tk()
+    build_ui(root)
+
     # Run the application
     root.mainloop()
@@ -0,0 +1,17 @@
+from setuptools import Extension, setup
+
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize("_calc.pyx")
+except ImportError:
+    # Cython is optional; the pure-Python fallback in calculator.py is used.
+    ext_modules = []
+
+ext_modules.append(Extension("_calcfast", ["_calcfast.c"]))
+
+setup(
+    name="simplecalc",
+    version="0.1.0",
+    py_modules=["calculator", "batch", "_numba_overloads"],
+    ext_modules=ext_modules,
+)
@@ -0,0 +1,51 @@
+import unittest
+
+try:
+    import numpy as np
+    from batch import (
+        batch_apply, OP_ADD, OP_SUBTRACT, OP_MULTIPLY, OP_DIVIDE
+    )
+    _BATCH_AVAILABLE = True
+except ImportError:
+    _BATCH_AVAILABLE = False
+
+
+@unittest.skipUnless(_BATCH_AVAILABLE, "requires numba and numpy")
+class TestBatchApply(unittest.TestCase):
+
+    def setUp(self):
+        self.x = np.array([1.0, 6.0, -2.0, 0.0])
+        self.y = np.array([2.0, 3.0, 4.0, 5.0])
+
+    def test_add(self):
+        result = batch_apply(OP_ADD, self.x, self.y)
+        np.testing.assert_array_equal(result, [3.0, 9.0, 2.0, 5.0])
+
+    def test_subtract(self):
+        result = batch_apply(OP_SUBTRACT, self.x, self.y)
+        np.testing.assert_array_equal(result, [-1.0, 3.0, -6.0, -5.0])
+
+    def test_multiply(self):
+        result = batch_apply(OP_MULTIPLY, self.x, self.y)
+        np.testing.assert_array_equal(result, [2.0, 18.0, -8.0, 0.0])
+
+    def test_divide(self):
+        result = batch_apply(OP_DIVIDE, self.x, self.y)
+        np.testing.assert_array_equal(result, [0.5, 2.0, -0.5, 0.0])
+
+    def test_divide_by_zero_is_ieee(self):
+        result = batch_apply(OP_DIVIDE, self.x, np.zeros_like(self.x))
+        self.assertEqual(result[0], np.inf)
+        self.assertTrue(np.isnan(result[3]))
+
+    def test_invalid_operation_code(self):
+        with self.assertRaises(ValueError):
+            batch_apply(42, self.x, self.y)
+
+    def test_shape_mismatch(self):
+        with self.assertRaises(ValueError):
+            batch_apply(OP_ADD, self.x, self.y[:2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,13 +1,36 @@
+import math
+import tkinter as tk
 import unittest
 from unittest.mock import MagicMock
 from calculator import (
     add, subtract, multiply, divide,
-    calculate, DIVISION_BY_ZERO_ERROR, INPUT_ERROR, MATH_ERROR
+    calculate, build_ui, _CALCS, INPUT_ERROR, MATH_ERROR
 )
 
+try:
+    import _calcfast
+except ImportError:
+    _calcfast = None
+
+
+def _tk_available() -> bool:
+    """Return True if a Tk root can be created (i.e. a display exists)."""
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        return False
+    root.destroy()
+    return True
+
 
 class TestCalculator(unittest.TestCase):
 
+    def setUp(self):
+        self.get_num1 = MagicMock()
+        self.get_num2 = MagicMock()
+        self.get_operation = MagicMock()
+        self.set_result = MagicMock()
+
     def test_add(self):
         self.assertEqual(add(1, 2), 3)
         self.assertEqual(add(-1, 1), 0)
@@ -15,22 +38,17 @@ class TestCalculator(unittest.TestCase):
         self.assertEqual(add(1.5, 2.5), 4.0)
 
     def test_calculate_add(self):
-        mock_entry_num1 = MagicMock()
-        mock_entry_num2 = MagicMock()
-        mock_operation_var = MagicMock()
-        mock_result_label = MagicMock()
-
-        mock_entry_num1.get.return_value = '3'
-        mock_entry_num2.get.return_value = '5'
-        mock_operation_var.get.return_value = '+'
+        self.get_num1.return_value = '3'
+        self.get_num2.return_value = '5'
+        self.get_operation.return_value = '+'
 
         calculate(
-            mock_entry_num1,
-            mock_entry_num2,
-            mock_operation_var,
-            mock_result_label
+            self.get_num1,
+            self.get_num2,
+            self.get_operation,
+            self.set_result
         )
-        result = mock_result_label.config.call_args[1]['text']
+        result = self.set_result.call_args[1]['text']
         self.assertEqual(result, "Result: 8.0")
 
     def test_subtract(self):
@@ -40,41 +58,31 @@ class TestCalculator(unittest.TestCase):
         self.assertEqual(subtract(10.5, 2.5), 8.0)
 
     def test_calculate_subtract_w_negative_result(self):
-        mock_entry_num1 = MagicMock()
-        mock_entry_num2 = MagicMock()
-        mock_operation_var = MagicMock()
-        mock_result_label = MagicMock()
-
-        mock_entry_num1.get.return_value = '30'
-        mock_entry_num2.get.return_value = '53'
-        mock_operation_var.get.return_value = '-'
+        self.get_num1.return_value = '30'
+        self.get_num2.return_value = '53'
+        self.get_operation.return_value = '-'
 
         calculate(
-            mock_entry_num1,
-            mock_entry_num2,
-            mock_operation_var,
-            mock_result_label
+            self.get_num1,
+            self.get_num2,
+            self.get_operation,
+            self.set_result
         )
-        result = mock_result_label.config.call_args[1]['text']
+        result = self.set_result.call_args[1]['text']
         self.assertEqual(result, "Result: -23.0")
 
     def test_calculate_subtract_w_positive_result(self):
-        mock_entry_num1 = MagicMock()
-        mock_entry_num2 = MagicMock()
-        mock_operation_var = MagicMock()
-        mock_result_label = MagicMock()
-
-        mock_entry_num1.get.return_value = '50'
-        mock_entry_num2.get.return_value = '13'
-        mock_operation_var.get.return_value = '-'
+        self.get_num1.return_value = '50'
+        self.get_num2.return_value = '13'
+        self.get_operation.return_value = '-'
 
         calculate(
-            mock_entry_num1,
-            mock_entry_num2,
-            mock_operation_var,
-            mock_result_label
+            self.get_num1,
+            self.get_num2,
+            self.get_operation,
+            self.set_result
         )
-        result = mock_result_label.config.call_args[1]['text']
+        result = self.set_result.call_args[1]['text']
         self.assertEqual(result, "Result: 37.0")
 
     def test_multiply(self):
@@ -84,22 +92,17 @@ class TestCalculator(unittest.TestCase):
         self.assertEqual(multiply(1.5, 2), 3.0)
 
     def test_calculate_multiply(self):
-        mock_entry_num1 = MagicMock()
-        mock_entry_num2 = MagicMock()
-        mock_operation_var = MagicMock()
-        mock_result_label = MagicMock()
-
-        mock_entry_num1.get.return_value = '50'
-        mock_entry_num2.get.return_value = '13'
-        mock_operation_var.get.return_value = '*'
+        self.get_num1.return_value = '50'
+        self.get_num2.return_value = '13'
+        self.get_operation.return_value = '*'
 
         calculate(
-            mock_entry_num1,
-            mock_entry_num2,
-            mock_operation_var,
-            mock_result_label
+            self.get_num1,
+            self.get_num2,
+            self.get_operation,
+            self.set_result
         )
-        result = mock_result_label.config.call_args[1]['text']
+        result = self.set_result.call_args[1]['text']
         self.assertEqual(result, "Result: 650.0")
 
     def test_divide(self):
@@ -107,88 +110,147 @@ class TestCalculator(unittest.TestCase):
         self.assertEqual(divide(5, 2), 2.5)
         self.assertEqual(divide(-6, 2), -3.0)
         self.assertEqual(divide(0, 5), 0.0)
-        self.assertEqual(divide(1, 0), "Error: Division by zero")
+        self.assertTrue(math.isnan(divide(1, 0)))
 
     def test_calculate_divide(self):
-        mock_entry_num1 = MagicMock()
-        mock_entry_num2 = MagicMock()
-        mock_operation_var = MagicMock()
-        mock_result_label = MagicMock()
-
-        mock_entry_num1.get.return_value = '40'
-        mock_entry_num2.get.return_value = '2'
-        mock_operation_var.get.return_value = '/'
+        self.get_num1.return_value = '40'
+        self.get_num2.return_value = '2'
+        self.get_operation.return_value = '/'
 
         calculate(
-            mock_entry_num1,
-            mock_entry_num2,
-            mock_operation_var,
-            mock_result_label
+            self.get_num1,
+            self.get_num2,
+            self.get_operation,
+            self.set_result
         )
-        result = mock_result_label.config.call_args[1]['text']
+        result = self.set_result.call_args[1]['text']
         self.assertEqual(result, "Result: 20.0")
 
     def test_calculate_divide_by_zero_error(self):
-        mock_entry_num1 = MagicMock()
-        mock_entry_num2 = MagicMock()
-        mock_operation_var = MagicMock()
-        mock_result_label = MagicMock()
-
-        mock_entry_num1.get.return_value = '40'
-        mock_entry_num2.get.return_value = '0'
-        mock_operation_var.get.return_value = '/'
+        self.get_num1.return_value = '40'
+        self.get_num2.return_value = '0'
+        self.get_operation.return_value = '/'
 
         calculate(
-            mock_entry_num1,
-            mock_entry_num2,
-            mock_operation_var,
-            mock_result_label
+            self.get_num1,
+            self.get_num2,
+            self.get_operation,
+            self.set_result
         )
-        result = mock_result_label.config.call_args[1]['text']
+        result = self.set_result.call_args[1]['text']
         self.assertEqual(result, MATH_ERROR)
 
+    def test_calculate_add_nan_input_shows_result(self):
+        self.get_num1.return_value = 'nan'
+        self.get_num2.return_value = '1'
+        self.get_operation.return_value = '+'
+
+        calculate(
+            self.get_num1,
+            self.get_num2,
+            self.get_operation,
+            self.set_result
+        )
+        result = self.set_result.call_args[1]['text']
+        self.assertEqual(result, "Result: nan")
+
     def test_divide_by_zero(self):
-        self.assertEqual(divide(1, 0), DIVISION_BY_ZERO_ERROR)
+        self.assertTrue(math.isnan(divide(1, 0)))
 
     def test_invalid_operation(self):
-        mock_entry_num1 = MagicMock()
-        mock_entry_num2 = MagicMock()
-        mock_operation_var = MagicMock()
-        mock_result_label = MagicMock()
-
-        mock_operation_var.get.return_value = '%'
+        self.get_num1.return_value = '1'
+        self.get_num2.return_value = '2'
+        self.get_operation.return_value = '%'
 
         calculate(
-            mock_entry_num1,
-            mock_entry_num2,
-            mock_operation_var,
-            mock_result_label
+            self.get_num1,
+            self.get_num2,
+            self.get_operation,
+            self.set_result
         )
-        mock_result_label.config.assert_called_with(
+        self.set_result.assert_called_with(
             text="Result: Invalid operation"
         )
 
     def test_invalid_input(self):
-        mock_entry_num1 = MagicMock()
-        mock_entry_num2 = MagicMock()
-        mock_operation_var = MagicMock()
-        mock_result_label = MagicMock()
-
-        mock_entry_num1.get.return_value = 'abc'
-        mock_entry_num2.get.return_value = '123'
+        self.get_num1.return_value = 'abc'
+        self.get_num2.return_value = '123'
+        self.get_operation.return_value = '+'
 
         calculate(
-            mock_entry_num1,
-            mock_entry_num2,
-            mock_operation_var,
-            mock_result_label
+            self.get_num1,
+            self.get_num2,
+            self.get_operation,
+            self.set_result
         )
-        mock_result_label.config.assert_called_with(text=INPUT_ERROR)
+        self.set_result.assert_called_with(text=INPUT_ERROR)
+
+    def test_specialized_calculate_add(self):
+        self.get_num1.return_value = '3'
+        self.get_num2.return_value = '5'
+
+        _CALCS['+'](self.get_num1, self.get_num2, self.set_result)
+        result = self.set_result.call_args[1]['text']
+        self.assertEqual(result, "Result: 8.0")
+
+    def test_specialized_calculate_multiply_nan_input_shows_result(self):
+        self.get_num1.return_value = 'nan'
+        self.get_num2.return_value = '2'
+
+        _CALCS['*'](self.get_num1, self.get_num2, self.set_result)
+        result = self.set_result.call_args[1]['text']
+        self.assertEqual(result, "Result: nan")
+
+    def test_specialized_calculate_divide_by_zero_error(self):
+        self.get_num1.return_value = '40'
+        self.get_num2.return_value = '0'
+
+        _CALCS['/'](self.get_num1, self.get_num2, self.set_result)
+        result = self.set_result.call_args[1]['text']
+        self.assertEqual(result, MATH_ERROR)
 
     def test_division_edge_cases(self):
         self.assertAlmostEqual(divide(1e308, 1e308), 1.0)
         self.assertEqual(divide(0, 1e308), 0.0)
 
 
+@unittest.skipUnless(_calcfast is not None, "_calcfast extension not built")
+class TestCalcDispatch(unittest.TestCase):
+
+    def test_op_codes(self):
+        self.assertEqual(_calcfast.calc_dispatch(0, 3.0, 5.0), 8.0)
+        self.assertEqual(_calcfast.calc_dispatch(1, 5.0, 3.0), 2.0)
+        self.assertEqual(_calcfast.calc_dispatch(2, 4.0, 2.5), 10.0)
+        self.assertEqual(_calcfast.calc_dispatch(3, 5.0, 2.0), 2.5)
+
+    def test_divide_by_zero_is_nan(self):
+        self.assertTrue(math.isnan(_calcfast.calc_dispatch(3, 1.0, 0.0)))
+
+    def test_invalid_op_code(self):
+        with self.assertRaises(ValueError):
+            _calcfast.calc_dispatch(4, 1.0, 2.0)
+
+
+@unittest.skipUnless(_tk_available(), "Tk requires a display")
+class TestCalculatorUI(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # One Tcl interpreter for the whole TestCase; starting Tk per
+        # test would dominate the GUI tests' runtime.
+        cls.root = tk.Tk()
+        build_ui(cls.root)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.root.destroy()
+
+    def test_build_ui_creates_widgets(self):
+        classes = [w.winfo_class() for w in self.root.winfo_children()]
+        self.assertEqual(classes.count('Entry'), 2)
+        self.assertEqual(classes.count('Radiobutton'), 4)
+        self.assertIn('Button', classes)
+
+
 if __name__ == '__main__':
     unittest.main()